@@ -71,16 +71,27 @@ def managed[T, **P, R](
         return ManagedWrapper(provider_type=as_)
 
 
-@dataclass(kw_only=True, repr=True)
+@dataclass(kw_only=True, repr=True, frozen=True, slots=True)
 class DependencyOption:
     provider_type: ConstructableProviderType
 
 
+# options are immutable, so share one instance per provider type
+_dependency_options: Final[dict[ConstructableProviderType, DependencyOption]] = {
+    "singleton": DependencyOption(provider_type="singleton"),
+    "factory": DependencyOption(provider_type="factory"),
+}
+
+
+def shared_dependency_option(provider_type: ConstructableProviderType) -> DependencyOption:
+    return _dependency_options[provider_type]
+
+
 @dataclass(kw_only=True)
 class ManagedWrapper:
     """Provide precise __call__() overload definition."""
 
-    _DEPENDENCY_OPTION_KEY: ClassVar[Final[str]] = "__dependency_option__"
+    DEPENDENCY_OPTION_KEY: ClassVar[Final[str]] = "__dependency_option__"
 
     provider_type: Final[ConstructableProviderType]
 
@@ -97,8 +108,8 @@ class ManagedWrapper:
         self,
         ctor: type[T] | Callable[P, R],
     ) -> type[T] | Callable[P, R]:
-        dependency_option = DependencyOption(provider_type=self.provider_type)
-        setattr(ctor, self._DEPENDENCY_OPTION_KEY, dependency_option)
+        dependency_option = shared_dependency_option(self.provider_type)
+        setattr(ctor, self.DEPENDENCY_OPTION_KEY, dependency_option)
         return ctor
 
     @classmethod
@@ -106,4 +117,4 @@ class ManagedWrapper:
         cls,
         ctor: Callable[..., Any],
     ) -> DependencyOption | None:
-        return getattr(ctor, cls._DEPENDENCY_OPTION_KEY, None)
+        return getattr(ctor, cls.DEPENDENCY_OPTION_KEY, None)
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Mapping
-from typing import Any, Literal, override
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from keyword import iskeyword
+from typing import Any, Final, Literal, override
 
 
 class Provider[T](ABC):
@@ -39,6 +41,8 @@ class Provider[T](ABC):
     Subclasses must handle initialization themselves.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __call__(self) -> T:
         raise NotImplementedError
@@ -52,6 +56,8 @@ class Provider[T](ABC):
 class ConstructableProvider[T](Provider[T], ABC):
     """Abstraction of `must init then call to provide`."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
         self,
@@ -62,10 +68,18 @@ class ConstructableProvider[T](Provider[T], ABC):
         raise NotImplementedError
 
 
+# calls of a FactoryProvider before compiling its builder (see `_compile_builder()`)
+COMPILE_AFTER_CALLS: Final = 8
+
+
 class FactoryProvider[T](ConstructableProvider[T]):
+    __slots__ = ("_args", "_build", "_calls", "_ctor", "_kwargs")
+
     _ctor: Callable[..., T]
     _args: tuple[Provider[Any], ...]
     _kwargs: Mapping[str, Provider[Any]]
+    _build: Callable[[], T] | None
+    _calls: int
 
     def __init__(
         self,
@@ -76,24 +90,52 @@ class FactoryProvider[T](ConstructableProvider[T]):
         self._ctor = ctor
         self._args = args
         self._kwargs = kwargs
+        self._build = None
+        self._calls = 0
 
     @override
     def __call__(self) -> T:
-        # use tuple() rather than generator to evaluate args before kwargs,
-        # so we can simulate the normal function invocation
-        args = tuple(arg() for arg in self._args)
-        kwargs = {kw: arg() for kw, arg in self._kwargs.items()}
+        build = self._build
+        if build is not None:
+            return build()
+
+        # Many factories are called only a few times (such as by the singletons depending on
+        # them), so the builder is compiled only for the hot ones, keeping it off the cold start.
+        # Checked here rather than by storing a bound method of self in `_build`,
+        # which would make every provider a reference cycle until compiled.
+        self._calls += 1
+        if self._calls >= COMPILE_AFTER_CALLS:
+            self._build = _compile_builder(self._ctor, self._args, self._kwargs)
 
-        return self._ctor(*args, **kwargs)
+        return _call_ctor(self._ctor, self._args, self._kwargs)
 
     @override
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}({self._ctor}, *, **)"
 
 
+class _Missing:
+    """Marks a not-yet-built singleton, so that a ctor returning `None` is distinguishable."""
+
+    __slots__ = ()
+
+    @override
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING: Final = _Missing()
+
+
 class SingletonProvider[T](ConstructableProvider[T]):
-    _factory: FactoryProvider[T]
-    _instance: T | None
+    # build by itself rather than through an inner FactoryProvider,
+    # which costs one more object per singleton and one more call on building
+    __slots__ = ("_args", "_ctor", "_instance", "_kwargs")
+
+    _ctor: Callable[..., T]
+    _args: tuple[Provider[Any], ...]
+    _kwargs: Mapping[str, Provider[Any]]
+    _instance: T | _Missing
 
     def __init__(
         self,
@@ -101,27 +143,40 @@ class SingletonProvider[T](ConstructableProvider[T]):
         *args: Provider[Any],
         **kwargs: Provider[Any],
     ) -> None:
-        self._factory = FactoryProvider(ctor, *args, **kwargs)
-        self._instance = None
+        self._ctor = ctor
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = _MISSING
 
     @override
     def __call__(self) -> T:
-        if self._instance is not None:
-            return self._instance
+        # built only once, so not worth compiling a builder like FactoryProvider does
+        instance = self._instance = _call_ctor(self._ctor, self._args, self._kwargs)
 
-        else:
-            self._instance = self._factory()
+        # once built, swap to the class which serves the instance unconditionally,
+        # so the steady state pays neither the check nor the building
+        self.__class__ = _BuiltSingletonProvider  # pyright: ignore[reportAttributeAccessIssue]
 
-            return self._instance
+        return instance
 
     @override
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__qualname__}(_factory={self._factory}, _instance={self._instance})"
-        )
+        return f"{self.__class__.__qualname__}({self._ctor}, *, **, _instance={self._instance})"
+
+
+class _BuiltSingletonProvider[T](SingletonProvider[T]):
+    """State of SingletonProvider after its instance has been built."""
+
+    __slots__ = ()
+
+    @override
+    def __call__(self) -> T:
+        return self._instance  # pyright: ignore[reportReturnType]
 
 
 class ObjectProvider[T](Provider[T]):
+    __slots__ = ("_instance",)
+
     _instance: T
 
     def __init__(self, obj: T) -> None:
@@ -137,10 +192,12 @@ class ObjectProvider[T](Provider[T]):
 
 
 class ListProvider[T](Provider[list[T]]):
-    _elements: list[Provider[T]]
+    __slots__ = ("_elements",)
 
-    def __init__(self, elements: list[Provider[T]]) -> None:
-        self._elements = [*elements]  # shallow copy
+    _elements: tuple[Provider[T], ...]
+
+    def __init__(self, elements: Iterable[Provider[T]]) -> None:
+        self._elements = tuple(elements)  # frozen copy, also faster to iterate than a list
 
     @override
     def __call__(self) -> list[T]:
@@ -149,7 +206,133 @@ class ListProvider[T](Provider[list[T]]):
 
     @override
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}({self._elements})"
+        return f"{self.__class__.__qualname__}({[*self._elements]})"
+
+
+# compiled builder factories, keyed by the shape of the call:
+# (count of args, names of kwargs, whether `type.__call__` is bypassed)
+_builder_factory_cache: dict[
+    tuple[int, tuple[str, ...], bool],
+    Callable[..., Callable[[], Any]],
+] = {}
+
+
+def _compile_builder[T](
+    ctor: Callable[..., T],
+    args: tuple[Provider[Any], ...],
+    kwargs: Mapping[str, Provider[Any]],
+) -> Callable[[], T]:
+    """Specialize `ctor(*(a() for a in args), **{k: p() for k, p in kwargs.items()})`.
+
+    The returned closure calls `ctor` with straight-line code, such as
+    `_ctor(_a0(), _a1(), name=_k0())`, so no tuple / dict is built nor unpacked per call.
+    Like a normal function invocation, args are evaluated before kwargs.
+
+    Each new shape costs an `exec()`, so only FactoryProviders which turn out to be hot
+    are compiled, and dataclass fields are passed positionally where possible,
+    which keeps most shapes down to the count of args.
+    """
+    # calling a class with kwargs makes `type.__call__` pack them into a dict for `__init__`,
+    # which costs more than allocating and initializing the instance by ourselves;
+    # being one more shape is fine, as only hot factories get here (`COMPILE_AFTER_CALLS`)
+    bypass_type_call = bool(kwargs) and _is_plainly_instantiated(ctor)
+
+    args_count = len(args)
+    kw_names = tuple(kwargs)
+    shape = (args_count, kw_names, bypass_type_call)
+
+    # the source is generated & compiled once per shape, then shared by all ctors of it
+    builder_factory = _builder_factory_cache.get(shape)
+    if builder_factory is None:
+        builder_factory = _make_builder_factory(
+            args_count,
+            kw_names,
+            bypass_type_call=bypass_type_call,
+        )
+        _builder_factory_cache[shape] = builder_factory
+
+    return builder_factory(ctor, *args, *kwargs.values())
+
+
+def _is_plainly_instantiated(ctor: Callable[..., Any]) -> bool:
+    """Whether `ctor(...)` is exactly `obj = object.__new__(ctor); obj.__init__(...)`."""
+    return (
+        isinstance(ctor, type)
+        and type(ctor).__call__ is type.__call__
+        and ctor.__new__ is object.__new__
+    )
+
+
+def _make_builder_factory(
+    args_count: int,
+    kw_names: tuple[str, ...],
+    *,
+    bypass_type_call: bool,
+) -> Callable[..., Callable[[], Any]]:
+    if not all(_is_plain_identifier(name) for name in kw_names):
+        # cannot be spelled in source, which is only possible by passing `**{...}` explicitly
+        return partial(_make_generic_builder, args_count, kw_names)
+
+    arg_vars = [f"_a{i}" for i in range(args_count)]
+    kwarg_vars = [f"_k{i}" for i in range(len(kw_names))]
+    call_args = [
+        *(f"{v}()" for v in arg_vars),
+        *(f"{name}={v}()" for name, v in zip(kw_names, kwarg_vars, strict=True)),
+    ]
+
+    params = ", ".join(["_ctor", *arg_vars, *kwarg_vars])
+
+    if bypass_type_call:
+        source = (
+            f"def _builder_factory({params}):\n"
+            f"    _init = _ctor.__init__\n"
+            f"    def _build():\n"
+            f"        _obj = _new(_ctor)\n"
+            f"        _init({', '.join(['_obj', *call_args])})\n"
+            f"        return _obj\n"
+            f"    return _build\n"
+        )
+
+    else:
+        source = (
+            f"def _builder_factory({params}):\n"
+            f"    def _build():\n"
+            f"        return _ctor({', '.join(call_args)})\n"
+            f"    return _build\n"
+        )
+
+    namespace: dict[str, Any] = {"_new": object.__new__}
+    exec(source, namespace)  # noqa: S102  # source is made of generated identifiers only
+
+    return namespace["_builder_factory"]
+
+
+def _is_plain_identifier(name: str) -> bool:
+    # `__debug__` is an identifier, but cannot be used as a keyword argument in source
+    return name.isidentifier() and not iskeyword(name) and name != "__debug__"
+
+
+def _make_generic_builder[T](
+    args_count: int,
+    kw_names: tuple[str, ...],
+    ctor: Callable[..., T],
+    *providers: Provider[Any],
+) -> Callable[[], T]:
+    args = providers[:args_count]
+    kwargs = dict(zip(kw_names, providers[args_count:], strict=True))
+
+    return partial(_call_ctor, ctor, args, kwargs)
+
+
+def _call_ctor[T](
+    ctor: Callable[..., T],
+    args: tuple[Provider[Any], ...],
+    kwargs: Mapping[str, Provider[Any]],
+) -> T:
+    return ctor(
+        *[arg() for arg in args],
+        **{kw: arg() for kw, arg in kwargs.items()},
+    )
 
 
 ConstructableProviderType = Literal["singleton", "factory"]
@@ -14,23 +14,26 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import sys
+import threading
 import types
 import typing
 from collections import defaultdict
 from collections.abc import Callable, Collection, Iterable
 from dataclasses import MISSING, dataclass, fields, is_dataclass
 from importlib import import_module
-from inspect import Parameter, getmembers, signature
+from inspect import Parameter, signature
 from pkgutil import walk_packages
+from weakref import WeakKeyDictionary
 
 if typing.TYPE_CHECKING:
     from _typeshed import DataclassInstance
 
 import managed._runtime_typing as rtt
-from managed._annotations import DependencyOption, ManagedWrapper
+from managed._annotations import DependencyOption, ManagedWrapper, shared_dependency_option
 from managed._providers import (
-    ConstructableProvider,
     ListProvider,
     ObjectProvider,
     Provider,
@@ -38,6 +41,7 @@ from managed._providers import (
 )
 from managed._utils import first, first_not_none
 from managed.errors import (
+    CircularDependencyError,
     ConstructorExistsError,
     DependencyNotFoundError,
     DiError,
@@ -55,14 +59,43 @@ from managed.errors import (
 )
 
 type _DependencyCtor = Callable[..., typing.Any]
+type _DependencyCtorKind = typing.Literal["dataclass", "func"]
 
+_object_ctor_option: typing.Final = shared_dependency_option("singleton")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
+class _CtorParam:
+    """Parameter of ctor to be injected."""
+
+    name: str
+    annotation: typing.Any
+    keyword_only: bool
+
+
+# Reflection (annotation eval, signature parsing) is expensive and its result never changes,
+# so it is done (and validated) once per function ctor and shared by every registry.
+# Classes are not cached, since the param types may refer back to them (such as a `Repo`
+# annotated with `Service | None`), and the cached params would then keep them alive forever.
+_ctor_params_cache: WeakKeyDictionary[
+    types.FunctionType,
+    tuple[_CtorParam, ...],
+] = WeakKeyDictionary()
+
+
+@dataclass(eq=False, slots=True)
 class _DependencyCtorContext:
     option: DependencyOption
+    kind: _DependencyCtorKind
     provider: Provider[typing.Any] | None
 
 
+class _BuildingState(threading.local):
+    # per thread, otherwise a ctor being built by another thread would look like a cycle
+    def __init__(self) -> None:
+        self.ctors: list[_DependencyCtor] = []
+
+
 class DependencyRegistry:
     _logger: logging.Logger
 
@@ -72,27 +105,45 @@ class DependencyRegistry:
     _proto_to_ctor_set: defaultdict[rtt.TypingGenericAlias | rtt.Type, set[_DependencyCtor]]
     _ctor_to_ctx: dict[_DependencyCtor, _DependencyCtorContext]
 
+    # ctors whose provider is being built by the current thread, for detecting circular deps
+    _building: _BuildingState
+
+    # Providers of each prototype, built lazily on the first resolution of it.
+    # The lists are shared with callers, who must not mutate them (ListProvider copies them).
+    _proto_to_providers: dict[rtt.TypingGenericAlias | rtt.Type, list[Provider[typing.Any]]]
+
+    # Resolution results of get_dependency() / get_dependencies(), keyed by `_resolution_key()`.
+    # Any registration may change how a type resolves, so both are cleared on it.
+    _resolved_provider_cache: dict[typing.Any, Provider[typing.Any]]
+    _resolved_providers_cache: dict[typing.Any, ListProvider[typing.Any]]
+
+    # `None` and the registry itself are registered on the first resolution rather than on init,
+    # so registries which are never resolved from (or only used briefly) do not pay for them
+    _builtin_vals_registered: bool
+
     def __init__(self) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._proto_to_ctor_set = defaultdict(set)
         self._ctor_to_ctx = {}
-
-        _ = self.register_val(None)
-        _ = self.register_val(self)
+        self._building = _BuildingState()
+        self._proto_to_providers = {}
+        self._resolved_provider_cache = {}
+        self._resolved_providers_cache = {}
+        self._builtin_vals_registered = False
 
     def get_dependency[T](self, dep_type: type[T]) -> T:
-        dep_rtt = rtt.literal_typing_to_runtime_typing(dep_type)
-
-        provider = first_not_none(
-            self._get_or_make_provider_from_registry(
-                possible_dep_rtt,
-                require_most_one_provider=True,
-            )
-            for possible_dep_rtt in rtt.unpack_if_union(dep_rtt)
-        )
+        key = dep_type if type(dep_type) is type else _resolution_key(dep_type)
+        try:
+            provider = self._resolved_provider_cache.get(key, None)
+        except TypeError:  # unhashable, such as `Annotated[Service, {"k": 1}]`
+            provider = self._resolve_provider(dep_type)
+        else:
+            if provider is None:
+                provider = self._resolve_provider(dep_type)
+                self._resolved_provider_cache[key] = provider
 
-        if provider is None:
-            raise DependencyNotFoundError(dep_rtt)
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return provider()
 
         self._logger.debug("Found %s", provider)
 
@@ -107,22 +158,20 @@ class DependencyRegistry:
         return dep
 
     def get_dependencies[T](self, dep_type: type[T]) -> list[T]:
-        dep_rtt = rtt.literal_typing_to_runtime_typing(dep_type)
-
-        providers = first_not_none(
-            self._get_or_make_provider_from_registry(
-                possible_dep_rtt,
-                require_most_one_provider=False,
-            )
-            for possible_dep_rtt in rtt.unpack_if_union(dep_rtt)
-        )
-
-        if not providers:
-            raise DependencyNotFoundError(dep_rtt)
+        key = dep_type if type(dep_type) is type else _resolution_key(dep_type)
+        try:
+            provider = self._resolved_providers_cache.get(key, None)
+        except TypeError:  # unhashable, such as `Annotated[Service, {"k": 1}]`
+            provider = self._resolve_list_provider(dep_type)
+        else:
+            if provider is None:
+                provider = self._resolve_list_provider(dep_type)
+                self._resolved_providers_cache[key] = provider
 
-        provider = ListProvider(providers)
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return provider()
 
-        self._logger.debug("Built an temporarily %s", provider)
+        self._logger.debug("Found %s", provider)
 
         dep = provider()
 
@@ -145,6 +194,34 @@ class DependencyRegistry:
 
         return self
 
+    def compile(self) -> typing.Self:
+        """Eagerly build the providers of all registered ctors, and resolve all registered types.
+
+        Each provider is built after the providers of its deps, the same order as lazy building,
+        so that missing / circular deps are reported here instead of on the first resolution.
+        Afterwards, resolving any registered type is a single lookup, even for the first time.
+        """
+        self._register_builtin_vals()
+
+        for ctor, ctx in list(self._ctor_to_ctx.items()):
+            _ = self._get_or_make_provider_of_ctor(ctor, ctx)
+
+        for proto in list(self._proto_to_ctor_set):
+            dep_type = typing.cast("type[typing.Any]", proto)
+            key = _resolution_key(dep_type)
+
+            # such as no unique one, which is only an error when it is actually resolved
+            with contextlib.suppress(DiError):
+                if key not in self._resolved_provider_cache:
+                    self._resolved_provider_cache[key] = self._resolve_provider(dep_type)
+
+            with contextlib.suppress(DiError):
+                if key not in self._resolved_providers_cache:
+                    provider = self._resolve_list_provider(dep_type)
+                    self._resolved_providers_cache[key] = provider
+
+        return self
+
     @typing.overload
     def register_ctor(
         self,
@@ -166,6 +243,13 @@ class DependencyRegistry:
     ) -> typing.Self:
         prototypes = self._get_prototypes_by_ctor(ctor)
 
+        # classify once here, rather than probing on each provider building
+        ctx = _DependencyCtorContext(
+            option=option,
+            kind=self._get_kind_of_ctor(ctor),
+            provider=None,
+        )
+
         for proto in prototypes:
             if not isinstance(proto, rtt.TypingGenericAlias | rtt.Type):
                 continue
@@ -174,20 +258,25 @@ class DependencyRegistry:
 
             if ctor not in ctor_set:
                 ctor_set.add(ctor)
-                self._ctor_to_ctx[ctor] = _DependencyCtorContext(
-                    option=option,
-                    provider=None,
-                )
+                self._ctor_to_ctx[ctor] = ctx
 
             else:
                 raise ConstructorExistsError(ctor)
 
+        self._invalidate_resolved_caches()
+
         return self
 
     def register_val(self, v: object) -> typing.Self:
         ctor = _ObjectCtor(v)
         prototypes = rtt.get_bases(rtt.literal_typing_to_runtime_typing(type(v)))
 
+        ctx = _DependencyCtorContext(
+            option=_object_ctor_option,
+            kind="func",
+            provider=ObjectProvider(v),
+        )
+
         for proto in prototypes:
             if not isinstance(proto, rtt.TypingGenericAlias | rtt.Type):
                 continue
@@ -196,16 +285,80 @@ class DependencyRegistry:
 
             if ctor not in ctor_set:
                 ctor_set.add(ctor)
-                self._ctor_to_ctx[ctor] = _DependencyCtorContext(
-                    option=DependencyOption(provider_type="singleton"),
-                    provider=ObjectProvider(v),
-                )
+                self._ctor_to_ctx[ctor] = ctx
 
             else:
                 raise ConstructorExistsError(ctor)
 
+        self._invalidate_resolved_caches()
+
         return self
 
+    def _resolve_provider(self, dep_type: type[typing.Any]) -> Provider[typing.Any]:
+        self._register_builtin_vals()
+
+        dep_rtt = rtt.literal_typing_to_runtime_typing(dep_type)
+
+        if isinstance(dep_rtt, rtt.TypesUnionType):
+            provider = first_not_none(
+                self._get_or_make_provider_from_registry(
+                    possible_dep_rtt,
+                    require_most_one_provider=True,
+                )
+                for possible_dep_rtt in rtt.my_get_args(dep_rtt)
+            )
+
+        else:  # fast path for the common non-union case
+            provider = self._get_or_make_provider_from_registry(
+                dep_rtt,
+                require_most_one_provider=True,
+            )
+
+        if provider is None:
+            raise DependencyNotFoundError(dep_rtt)
+
+        return provider
+
+    def _resolve_list_provider(self, dep_type: type[typing.Any]) -> ListProvider[typing.Any]:
+        self._register_builtin_vals()
+
+        dep_rtt = rtt.literal_typing_to_runtime_typing(dep_type)
+
+        if isinstance(dep_rtt, rtt.TypesUnionType):
+            providers = first_not_none(
+                self._get_or_make_provider_from_registry(
+                    possible_dep_rtt,
+                    require_most_one_provider=False,
+                )
+                for possible_dep_rtt in rtt.my_get_args(dep_rtt)
+            )
+
+        else:  # fast path for the common non-union case
+            providers = self._get_or_make_provider_from_registry(
+                dep_rtt,
+                require_most_one_provider=False,
+            )
+
+        if not providers:
+            raise DependencyNotFoundError(dep_rtt)
+
+        return ListProvider(providers)
+
+    def _register_builtin_vals(self) -> None:
+        if self._builtin_vals_registered:
+            return
+
+        self._builtin_vals_registered = True
+
+        for v in (None, self):
+            if _ObjectCtor(v) not in self._ctor_to_ctx:  # may be registered by user explicitly
+                _ = self.register_val(v)
+
+    def _invalidate_resolved_caches(self) -> None:
+        self._resolved_provider_cache.clear()
+        self._resolved_providers_cache.clear()
+        self._proto_to_providers.clear()
+
     @typing.overload
     def _get_or_make_provider_from_registry(
         self,
@@ -222,25 +375,28 @@ class DependencyRegistry:
         require_most_one_provider: typing.Literal[False],
     ) -> list[Provider[typing.Any]] | None: ...
 
-    def _get_or_make_provider_from_registry(  # noqa: C901, PLR0911, PLR0912
+    def _get_or_make_provider_from_registry(  # noqa: C901, PLR0912
         self,
         dep_type: rtt.MetaType,
         *,
         require_most_one_provider: bool,
     ) -> Provider[typing.Any] | list[Provider[typing.Any]] | None:
+        if type(dep_type) is rtt.Type:  # plain class, skip the `isinstance()` probes below
+            return self._select_providers(
+                dep_type,
+                require_most_one_provider=require_most_one_provider,
+            )
+
         # Eg:
         # `Annotated[list[Service], 1]`: Annotated + (list[Service], 1)
         # `Annotated[int, 1]`: Annotated + (int, 1)
         # `Annotated[Annotated[int, 1], 2]`: Annotated + (int, 1, 2)
-        if isinstance(dep_type, rtt.TypingAnnotatedAlias):
-            unannotated = first(rtt.my_get_args(dep_type))  # such as `list[Service]`, `int`
-            return self._get_or_make_provider_from_registry(
-                unannotated,
-                require_most_one_provider=require_most_one_provider,
-            )
+        # peel it off in place rather than by recursion
+        while isinstance(dep_type, rtt.TypingAnnotatedAlias):
+            dep_type = first(rtt.my_get_args(dep_type))  # such as `list[Service]`, `int`
 
         # Eg: `List[Service]`, `list[Service]`, `typing.Iterable[Service]`, `App[Service]`
-        elif isinstance(dep_type, rtt.TypingGenericAlias | rtt.TypesGenericAlias):
+        if isinstance(dep_type, rtt.TypingGenericAlias | rtt.TypesGenericAlias):
             origin_type = rtt.my_get_origin(dep_type)
 
             # `List[Service]`: list + (Service,)  # same as `list[Service]`
@@ -286,6 +442,10 @@ class DependencyRegistry:
                         )
                         break
 
+                    # a cycle is an error even if the dep is optional
+                    except CircularDependencyError:
+                        raise
+
                     except DiError:
                         pass
 
@@ -308,6 +468,17 @@ class DependencyRegistry:
 
         # Here we will get: `App[Service]`, `Service`
 
+        return self._select_providers(
+            dep_type,
+            require_most_one_provider=require_most_one_provider,
+        )
+
+    def _select_providers(
+        self,
+        dep_type: rtt.TypingGenericAlias | rtt.Type,
+        *,
+        require_most_one_provider: bool,
+    ) -> Provider[typing.Any] | list[Provider[typing.Any]] | None:
         providers = self._do_get_or_make_providers(dep_type)
         if providers is None:
             return None
@@ -325,6 +496,10 @@ class DependencyRegistry:
         self,
         dep_type: rtt.TypingGenericAlias | rtt.Type,
     ) -> list[Provider[typing.Any]] | None:
+        cached_providers = self._proto_to_providers.get(dep_type, None)
+        if cached_providers is not None:
+            return cached_providers
+
         dep_ctor_set = self._proto_to_ctor_set.get(dep_type, None)
         if dep_ctor_set is None:
             return None
@@ -335,99 +510,59 @@ class DependencyRegistry:
             if ctx is None:
                 continue
 
-            if ctx.provider is None:
-                ctx.provider = self._make_provider(ctor, ctx.option)
+            providers.append(self._get_or_make_provider_of_ctor(ctor, ctx))
 
-            providers.append(ctx.provider)
+        self._proto_to_providers[dep_type] = providers
 
         return providers
 
-    def _make_provider(
+    def _get_or_make_provider_of_ctor(
         self,
-        ctor: Callable[..., typing.Any],
-        option: DependencyOption,
+        ctor: _DependencyCtor,
+        ctx: _DependencyCtorContext,
     ) -> Provider[typing.Any]:
-        provider_class = provider_type_to_class[option.provider_type]
+        if ctx.provider is not None:
+            return ctx.provider
 
-        if is_dataclass(ctor):
-            if isinstance(ctor, type):
-                provider = self._make_provider_by_dataclass(ctor, provider_class)
+        # deps are built depth-first, so meeting a ctor under building again means a cycle
+        building_ctors = self._building.ctors
+        if ctor in building_ctors:
+            raise CircularDependencyError([*building_ctors[building_ctors.index(ctor) :], ctor])
 
-            else:
-                raise UnrecognizableDependencyTypeError(ctor)
-
-        else:
-            provider = self._make_provider_by_func(ctor, provider_class)
+        building_ctors.append(ctor)
+        try:
+            ctx.provider = self._make_provider(ctor, ctx)
+        finally:
+            _ = building_ctors.pop()
 
-        return provider
+        return ctx.provider
 
-    def _make_provider_by_dataclass(
-        self,
-        ctor: type[DataclassInstance],
-        provider_class: type[ConstructableProvider[typing.Any]],
-    ) -> Provider[typing.Any]:
-        params = fields(ctor)
-        annotations = typing.get_type_hints(ctor)
-        kwargs: dict[str, Provider[typing.Any]] = {}
-
-        for p in params:
-            if not p.init:
-                continue
-
-            if p.default is not MISSING or p.default_factory is not MISSING:
-                continue
-
-            annotation = annotations[p.name]
-
-            param_provider = self._get_or_make_provider_from_registry(
-                annotation,
-                require_most_one_provider=True,
-            )
-            if param_provider is None:
-                raise DependencyNotFoundError(annotation)
-
-            kwargs[p.name] = param_provider
-
-        return provider_class(ctor, **kwargs)
-
-    def _make_provider_by_func(
+    def _make_provider(
         self,
         ctor: Callable[..., typing.Any],
-        provider_class: type[ConstructableProvider[typing.Any]],
+        ctx: _DependencyCtorContext,
     ) -> Provider[typing.Any]:
-        params = list(signature(ctor, eval_str=True).parameters.values())
+        provider_class = provider_type_to_class[ctx.option.provider_type]
 
-        args: list[typing.Any] = []
-        kwargs: dict[str, Provider[typing.Any]] = {}
+        if ctx.kind == "dataclass" and not isinstance(ctor, type):
+            raise UnrecognizableDependencyTypeError(ctor)
 
-        for p in params:
-            annotation = p.annotation
-
-            if annotation is Parameter.empty:
-                raise ParameterNotAnnotatedError(ctor, p)
+        args: list[Provider[typing.Any]] = []
+        kwargs: dict[str, Provider[typing.Any]] = {}
 
+        for p in _get_ctor_params(ctor, ctx.kind):
             param_provider = self._get_or_make_provider_from_registry(
-                annotation,
+                p.annotation,
                 require_most_one_provider=True,
             )
             if param_provider is None:
-                raise DependencyNotFoundError(annotation)
-
-            match p.kind:
-                case Parameter.VAR_KEYWORD:
-                    raise VarKeywordParameterNotSupportedError(ctor, p)
-
-                case Parameter.VAR_POSITIONAL:
-                    raise VarPositionalParameterNotSupportedError(ctor, p)
-
-                case Parameter.POSITIONAL_ONLY:
-                    args.append(param_provider)
+                raise DependencyNotFoundError(p.annotation)
 
-                case Parameter.POSITIONAL_OR_KEYWORD:
-                    args.append(param_provider)
+            if p.keyword_only:
+                kwargs[p.name] = param_provider
 
-                case Parameter.KEYWORD_ONLY:
-                    kwargs[p.name] = param_provider
+            else:
+                args.append(param_provider)
 
         return provider_class(ctor, *args, **kwargs)
 
@@ -442,30 +577,40 @@ class DependencyRegistry:
             ]
         ] = []
 
-        scanning_modules: set[types.ModuleType] = set()
+        # keyed by module name, so overlapping packages are scanned only once
+        scanning_modules: dict[str, types.ModuleType] = {}
 
         for module in modules:
             if not hasattr(module, "__path__"):  # single-file module, which do not have sub-module
-                scanning_modules.add(module)
+                scanning_modules[module.__name__] = module
 
             else:
                 for mod_info in walk_packages(module.__path__, f"{module.__name__}."):
-                    mod = import_module(mod_info.name)
-                    scanning_modules.add(mod)
+                    if mod_info.name in scanning_modules:
+                        continue
 
-        for mod in scanning_modules:
-            for name, member in getmembers(mod):
-                if name.startswith("_"):
-                    continue
+                    # skip the import machinery (and its lock) for already imported modules
+                    mod = sys.modules.get(mod_info.name) or import_module(mod_info.name)
+                    scanning_modules[mod_info.name] = mod
+
+        # inlined ManagedWrapper.get_dependency_option(), as most members are not managed
+        option_key = ManagedWrapper.DEPENDENCY_OPTION_KEY
 
-                option = ManagedWrapper.get_dependency_option(member)
-                if option is None:
+        for mod in scanning_modules.values():
+            # unlike inspect.getmembers(), no sorting nor getattr() per name
+            for name, member in vars(mod).items():
+                option: DependencyOption | None = getattr(member, option_key, None)
+                if option is None or name.startswith("_"):
                     continue
 
                 dep_def_list.append((member, option))
 
         return dep_def_list
 
+    @staticmethod
+    def _get_kind_of_ctor(ctor: Callable[..., typing.Any]) -> _DependencyCtorKind:
+        return "dataclass" if is_dataclass(ctor) else "func"
+
     @staticmethod
     def _get_prototypes_by_ctor(
         ctor: Callable[..., typing.Any],
@@ -474,7 +619,9 @@ class DependencyRegistry:
             ret_type = rtt.literal_typing_to_runtime_typing(ctor)
 
         else:
-            ret_type = typing.get_type_hints(ctor).get("return", MISSING)
+            ret_type = rtt.resolved_hints(ctor).get("return", MISSING)
+            while isinstance(ret_type, rtt.TypingAnnotatedAlias):
+                ret_type = first(rtt.my_get_args(ret_type))
 
             if ret_type is MISSING:
                 raise ReturnTypeNotAnnotatedError(ctor)
@@ -493,13 +640,143 @@ class DependencyRegistry:
         return rtt.get_bases(ret_type)
 
 
-@dataclass(repr=True)
+def _resolution_key(dep_type: typing.Any) -> typing.Any:
+    # `A | B == B | A`, yet a union resolves to its first resolvable arg,
+    # so a union is keyed by its args in order rather than by itself
+    if isinstance(dep_type, rtt.TypesUnionType):
+        return (rtt.TypesUnionType, typing.get_args(dep_type))
+
+    return dep_type
+
+
+def _get_ctor_params(
+    ctor: Callable[..., typing.Any],
+    kind: _DependencyCtorKind,
+) -> tuple[_CtorParam, ...]:
+    if not isinstance(ctor, types.FunctionType):
+        return _inspect_ctor_params(ctor, kind)
+
+    params = _ctor_params_cache.get(ctor, None)
+    if params is None:
+        params = _inspect_ctor_params(ctor, kind)
+        _ctor_params_cache[ctor] = params
+
+    return params
+
+
+def _inspect_ctor_params(
+    ctor: Callable[..., typing.Any],
+    kind: _DependencyCtorKind,
+) -> tuple[_CtorParam, ...]:
+    match kind:
+        case "dataclass":
+            return _inspect_dataclass_params(typing.cast("type[DataclassInstance]", ctor))
+
+        case "func":
+            return _inspect_func_params(ctor)
+
+
+def _inspect_dataclass_params(ctor: type[DataclassInstance]) -> tuple[_CtorParam, ...]:
+    # without extras, since `Annotated` nested in a field type, such as
+    # `Service[Annotated[Repo, ...]]`, would not match the registered `Service[Repo]`
+    annotations = typing.get_type_hints(ctor)
+
+    # Passing positionally keeps builders independent of the field names, but it is only safe
+    # for the leading params of `__init__` which are exactly these fields, in the same order.
+    # `__init__` may be written by hand (or not be a python function at all), such as with
+    # `init=False`, so check it rather than assuming the generated one.
+    positional_names = _get_positional_param_names(ctor.__init__)[1:]  # without `self`
+    positional_count = 0
+
+    params: list[_CtorParam] = []
+
+    for f in fields(ctor):
+        if not f.init or f.default is not MISSING or f.default_factory is not MISSING:
+            continue
+
+        keyword_only = True
+        if (
+            f.kw_only is not True
+            and positional_count < len(positional_names)
+            and positional_names[positional_count] == f.name
+        ):
+            keyword_only = False
+            positional_count += 1
+
+        params.append(
+            _CtorParam(
+                name=sys.intern(f.name),
+                annotation=annotations[f.name],
+                keyword_only=keyword_only,
+            )
+        )
+
+    return tuple(params)
+
+
+def _get_positional_param_names(func: Callable[..., typing.Any]) -> tuple[str, ...]:
+    code = getattr(func, "__code__", None)
+    if not isinstance(code, types.CodeType):
+        return ()
+
+    return code.co_varnames[: code.co_argcount]
+
+
+def _inspect_func_params(ctor: Callable[..., typing.Any]) -> tuple[_CtorParam, ...]:
+    params: list[_CtorParam] = []
+
+    for p in signature(ctor, eval_str=True).parameters.values():
+        if p.annotation is Parameter.empty:
+            raise ParameterNotAnnotatedError(ctor, p)
+
+        match p.kind:
+            case Parameter.VAR_KEYWORD:
+                raise VarKeywordParameterNotSupportedError(ctor, p)
+
+            case Parameter.VAR_POSITIONAL:
+                raise VarPositionalParameterNotSupportedError(ctor, p)
+
+            case Parameter.POSITIONAL_ONLY | Parameter.POSITIONAL_OR_KEYWORD:
+                keyword_only = False
+
+            case Parameter.KEYWORD_ONLY:
+                keyword_only = True
+
+        params.append(
+            _CtorParam(
+                name=sys.intern(p.name),
+                annotation=p.annotation,
+                keyword_only=keyword_only,
+            )
+        )
+
+    return tuple(params)
+
+
 class _ObjectCtor:
+    """Ctor of a registered value, identified by the identity of the value.
+
+    So unhashable values can be registered, and no field-by-field `__eq__` is paid.
+    """
+
+    __slots__ = ("_val",)
+
     _val: typing.Any
 
+    def __init__(self, val: typing.Any) -> None:
+        self._val = val
+
     @typing.override
     def __hash__(self) -> int:
-        return hash(self._val)
+        return id(self._val)
+
+    @typing.override
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ObjectCtor) and other._val is self._val
+
+    @typing.override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(_val={self._val!r})"
 
     def __call__(self) -> typing.Any:
         return self._val
@@ -14,7 +14,8 @@
 
 import types
 import typing
-from collections import OrderedDict
+from collections.abc import Callable
+from weakref import WeakKeyDictionary
 
 from managed._utils import first
 
@@ -145,23 +146,77 @@ def literal_typing_to_runtime_typing(t: type, /) -> MonadMetaType: ...
 
 
 def literal_typing_to_runtime_typing(t: type | types.UnionType) -> MetaType:
-    return typing.cast(typing.Any, t)
+    # a pure re-typing, so skip the extra call of `typing.cast()`
+    return t  # pyright: ignore[reportReturnType]
 
 
-def unpack_if_union(t: MetaType) -> tuple[MonadMetaType, ...]:
-    match t:
-        case TypesUnionType():
-            return my_get_args(t)
-        case _:
-            return (t,)
+def _is_plain_single_inheritance(t: Type) -> bool:
+    return len(t.__bases__) <= 1 and "__orig_bases__" not in t.__dict__
 
 
 def _my_get_original_bases(t: Type) -> tuple[MonadMetaType, ...]:
     return types.get_original_bases(typing.cast(typing.Any, t))
 
 
+# Bases of a type never change, so compute them once per type.
+# Weakly keyed, so that local / dynamic classes are not kept alive by the cache;
+# for the same reason, the type itself (the first of its bases) is left out of the value.
+_get_bases_cache: WeakKeyDictionary[MonadMetaType, tuple[MonadMetaType, ...]] = WeakKeyDictionary()
+
+
 def get_bases(t: MonadMetaType) -> tuple[MonadMetaType, ...]:
-    result: OrderedDict[MonadMetaType, typing.Literal[True]] = OrderedDict()
+    try:
+        super_bases = _get_bases_cache.get(t)
+    except TypeError:  # not weak-referenceable
+        return _compute_bases(t)
+
+    if super_bases is not None:
+        return (t, *super_bases)
+
+    bases = _compute_bases(t)
+    if bases[0] is t:  # always, except `typing.Generic` itself
+        _get_bases_cache[t] = bases[1:]
+
+    return bases
+
+
+def _compute_bases(t: MonadMetaType) -> tuple[MonadMetaType, ...]:
+    if type(t) is Type and all(_is_plain_single_inheritance(c) for c in t.__mro__):
+        # no generic / annotated base, and no multiple inheritance (where the deep-first
+        # order differs from C3 MRO), so the MRO already cached by CPython is the answer
+        return t.__mro__
+
+    return _do_get_bases(t)
+
+
+_resolved_hints_cache: WeakKeyDictionary[types.FunctionType, dict[str, typing.Any]] = (
+    WeakKeyDictionary()
+)
+
+
+def resolved_hints(obj: Callable[..., typing.Any]) -> dict[str, typing.Any]:
+    """`typing.get_type_hints(obj, include_extras=True)`, evaluated once per function.
+
+    Classes are not cached, since their hints may refer to themselves (such as
+    `parent: Node | None`), and the cached hints would then keep them alive forever.
+
+    The returned dict is shared, do not mutate it.
+    """
+    if not isinstance(obj, types.FunctionType):
+        return typing.get_type_hints(obj, include_extras=True)
+
+    hints = _resolved_hints_cache.get(obj)
+    if hints is None:
+        hints = typing.get_type_hints(obj, include_extras=True)
+        _resolved_hints_cache[obj] = hints
+
+    return hints
+
+
+def _do_get_bases(t: MonadMetaType) -> tuple[MonadMetaType, ...]:
+    # ordered set: `seen` for membership, `result` for order
+    result: list[MonadMetaType] = []
+    seen: set[MonadMetaType] = set()
 
     stack = [t]
     while stack:
@@ -169,8 +224,6 @@ def get_bases(t: MonadMetaType) -> tuple[MonadMetaType, ...]:
 
         match curr:
             case TypingAnnotatedAlias():
-                result[curr] = True
-
                 parent = first(my_get_args(curr))
                 if isinstance(parent, TypesUnionType):
                     raise _ImpossibleError("cannot create 'types.UnionType' instances")
@@ -182,33 +235,24 @@ def get_bases(t: MonadMetaType) -> tuple[MonadMetaType, ...]:
                 if orig is TypingGeneric:
                     continue
 
-                result[curr] = True
-
                 stack.append(orig)
 
             case Type():
-                result[curr] = True
-
                 stack.extend(reversed(_my_get_original_bases(curr)))  # deep-first
 
-    if TypingGeneric in result:
-        _ = result.pop(TypingGeneric, True)
-        result[TypingGeneric] = True
-
-    _ = result.pop(Object, True)
-    result[Object] = True
-
-    return tuple(result)
-
-class T[*A, B]:
-    t: tuple[*A]
-    v: B
+        if curr not in seen:
+            seen.add(curr)
+            result.append(curr)
 
-class A[**P, Z]: ...
+    if TypingGeneric in seen:
+        result.remove(TypingGeneric)
+        result.append(TypingGeneric)
 
-T[int, str, float]().v
+    if Object in seen:
+        result.remove(Object)
+    result.append(Object)
 
-class Specialization(dict[])
+    return tuple(result)
 
 
 class _ImpossibleError(Exception):
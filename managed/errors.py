@@ -12,9 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections.abc import Callable
-from inspect import Parameter
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from inspect import Parameter
+
+# The messages are formatted in `__str__`, only when an error is actually printed,
+# the raw values are kept both as attributes and in `args` (which keeps pickling working).
 
 
 class DiError(Exception): ...
@@ -22,68 +29,148 @@ class DiError(Exception): ...
 
 class DependencyNotFoundError(DiError):
     def __init__(self, dep_type: Any) -> None:
-        super().__init__(f"Dependency not found for {dep_type}")
+        super().__init__(dep_type)
+        self.dep_type = dep_type
+
+    @override
+    def __str__(self) -> str:
+        return f"Dependency not found for {self.dep_type}"
 
 
 class NoUniqueDependencyError(DiError):
     def __init__(self, dep_type: Any) -> None:
-        super().__init__(f"No unique dependency for type {dep_type}")
+        super().__init__(dep_type)
+        self.dep_type = dep_type
+
+    @override
+    def __str__(self) -> str:
+        return f"No unique dependency for type {self.dep_type}"
 
 
 class UnrecognizableDependencyTypeError(DiError):
     def __init__(self, dep_type: Any) -> None:
-        super().__init__(f"Unrecognizable dependency type {dep_type}")
+        super().__init__(dep_type)
+        self.dep_type = dep_type
+
+    @override
+    def __str__(self) -> str:
+        return f"Unrecognizable dependency type {self.dep_type}"
 
 
 class UnsupportedContainerTypeError(DiError):
     def __init__(self, dep_type: Any) -> None:
-        super().__init__(f"Unsupported container type {dep_type}")
+        super().__init__(dep_type)
+        self.dep_type = dep_type
+
+    @override
+    def __str__(self) -> str:
+        return f"Unsupported container type {self.dep_type}"
 
 
 class UnsupportedGenericTypeError(DiError):
     def __init__(self, dep_type: Any) -> None:
-        super().__init__(f"Unsupported generic type {dep_type}")
+        super().__init__(dep_type)
+        self.dep_type = dep_type
+
+    @override
+    def __str__(self) -> str:
+        return f"Unsupported generic type {self.dep_type}"
 
 
 class ParameterNotAnnotatedError(DiError):
     def __init__(self, func: Callable[..., Any], param: Parameter) -> None:
-        super().__init__(f"Parameter `{param.name}` of function `{func}` is not annotated")
+        super().__init__(func, param)
+        self.func = func
+        self.param = param
+
+    @override
+    def __str__(self) -> str:
+        return f"Parameter `{self.param.name}` of function `{self.func}` is not annotated"
 
 
 class VarKeywordParameterNotSupportedError(DiError):
     def __init__(self, func: Callable[..., Any], param: Parameter) -> None:
-        super().__init__(
-            f"VAR_KEYWORD parameter `{param.name}` of function `{func}` is not supported"
+        super().__init__(func, param)
+        self.func = func
+        self.param = param
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"VAR_KEYWORD parameter `{self.param.name}` of function `{self.func}` is not supported"
         )
 
 
 class VarPositionalParameterNotSupportedError(DiError):
     def __init__(self, func: Callable[..., Any], param: Parameter) -> None:
-        super().__init__(
-            f"VAR_POSITIONAL parameter `{param.name}` of function `{func}` is not supported"
+        super().__init__(func, param)
+        self.func = func
+        self.param = param
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"VAR_POSITIONAL parameter `{self.param.name}` "
+            f"of function `{self.func}` is not supported"
         )
 
 
 class ReturnTypeNotAnnotatedError(DiError):
     def __init__(self, func: Callable[..., Any]) -> None:
-        super().__init__(f"Return of function `{func}` is not annotated")
+        super().__init__(func)
+        self.func = func
+
+    @override
+    def __str__(self) -> str:
+        return f"Return of function `{self.func}` is not annotated"
 
 
 class ReturnTypeIsNoneError(DiError):
     def __init__(self, func: Callable[..., Any]) -> None:
-        super().__init__(f"Return of function `{func}` cannot be None or types.NoneType")
+        super().__init__(func)
+        self.func = func
+
+    @override
+    def __str__(self) -> str:
+        return f"Return of function `{self.func}` cannot be None or types.NoneType"
 
 
 class ReturnTypeIsUnionError(DiError):
     def __init__(self, func: Callable[..., Any]) -> None:
-        super().__init__(f"Return of function `{func}` cannot be types.UnionType")
+        super().__init__(func)
+        self.func = func
+
+    @override
+    def __str__(self) -> str:
+        return f"Return of function `{self.func}` cannot be types.UnionType"
 
 
 class ReturnTypeIsNonTypeError(DiError):
     def __init__(self, func: Callable[..., Any]) -> None:
-        super().__init__(f"Return of function `{func}` must be type")
+        super().__init__(func)
+        self.func = func
+
+    @override
+    def __str__(self) -> str:
+        return f"Return of function `{self.func}` must be type"
 
 
 class ConstructorExistsError(DiError):
     def __init__(self, func: Callable[..., Any]) -> None:
-        super().__init__(f"Constructor `{func}` has already registered")
+        super().__init__(func)
+        self.func = func
+
+    @override
+    def __str__(self) -> str:
+        return f"Constructor `{self.func}` has already registered"
+
+
+class CircularDependencyError(DiError):
+    def __init__(self, path: Sequence[Callable[..., Any]]) -> None:
+        super().__init__(tuple(path))
+        self.path = tuple(path)  # ctors in building order, the first one repeated at the end
+
+    @override
+    def __str__(self) -> str:
+        cycle = " -> ".join(f"`{func}`" for func in self.path)
+        return f"Circular dependency: {cycle}"
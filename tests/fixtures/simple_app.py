@@ -13,7 +13,6 @@
 # limitations under the License.
 
 from dataclasses import dataclass
-from typing import override
 
 from managed import managed
 
@@ -51,24 +50,16 @@ class Controller: ...
 
 
 @managed
-@dataclass
+@dataclass(eq=False)
 class SimpleUserController(Controller):
     svc: SimpleUserService
 
-    @override
-    def __hash__(self) -> int:  # only for test
-        return id(self)
-
 
 @managed
-@dataclass
+@dataclass(eq=False)
 class SimpleOrgController(Controller):
     svc: SimpleOrgService
 
-    @override
-    def __hash__(self) -> int:  # only for test
-        return id(self)
-
 
 @managed
 @dataclass
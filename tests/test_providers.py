@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+from typing import override
 
 from managed._providers import (
+    COMPILE_AFTER_CALLS,
     FactoryProvider,
     ListProvider,
     ObjectProvider,
@@ -59,6 +61,77 @@ def test_factory_provider():
     assert a.foo is not b.foo
 
 
+def test_factory_provider_with_args_and_kwargs():
+    calls: list[str] = []
+
+    def make(name: str) -> str:
+        calls.append(name)
+        return name
+
+    def foo(a: str, /, b: str, *, c: str) -> tuple[str, str, str]:
+        return (a, b, c)
+
+    provider = FactoryProvider(
+        foo,
+        FactoryProvider(make, ObjectProvider("a")),
+        FactoryProvider(make, ObjectProvider("b")),
+        c=FactoryProvider(make, ObjectProvider("c")),
+    )
+
+    # also past the calls after which the builder is compiled
+    for _ in range(COMPILE_AFTER_CALLS + 1):
+        calls.clear()
+        assert provider() == ("a", "b", "c")
+        assert calls == ["a", "b", "c"]  # args are evaluated before kwargs
+
+
+def test_factory_provider_with_kwargs_of_class():
+    @dataclass(kw_only=True)
+    class Plain:
+        value: int
+
+    class WithNew:
+        from_new: int = 0
+
+        def __new__(cls, *, value: int) -> "WithNew":
+            obj = super().__new__(cls)
+            obj.from_new = value
+            return obj
+
+    class Meta(type):
+        @override
+        def __call__(cls, **kwargs: int) -> int:
+            return kwargs["value"]
+
+    class WithMeta(metaclass=Meta): ...
+
+    plain_provider = FactoryProvider(Plain, value=ObjectProvider(1))
+    with_new_provider = FactoryProvider(WithNew, value=ObjectProvider(2))
+    with_meta_provider = FactoryProvider(WithMeta, value=ObjectProvider(3))
+
+    # also past the calls after which the builder is compiled
+    for _ in range(COMPILE_AFTER_CALLS + 1):
+        plain = plain_provider()
+        assert type(plain) is Plain
+        assert plain.value == 1
+
+        assert with_new_provider().from_new == 2
+
+        assert with_meta_provider() == 3
+
+
+def test_factory_provider_with_kwargs_not_in_source():
+    def make(**kwargs: int) -> dict[str, int]:
+        return kwargs
+
+    provider = FactoryProvider(
+        make, **{"__debug__": ObjectProvider(1), "not-a-name": ObjectProvider(2)}
+    )
+
+    for _ in range(COMPILE_AFTER_CALLS + 1):
+        assert provider() == {"__debug__": 1, "not-a-name": 2}
+
+
 def test_singleton_provider():
     class Baz:
         pass
@@ -81,6 +154,21 @@ def test_singleton_provider_with_args():
     assert a is b
 
 
+def test_singleton_provider_builds_once():
+    calls: list[None] = []
+
+    def make_none() -> None:
+        calls.append(None)
+
+    provider = SingletonProvider(make_none)
+    assert "_instance=<missing>" in repr(provider)
+
+    assert provider() is None
+    assert "_instance=None" in repr(provider)
+    assert provider() is None
+    assert len(calls) == 1
+
+
 def test_object_provider():
     obj = {"foo": "bar"}
     provider = ObjectProvider(obj)
@@ -12,10 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any
+import gc
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import KW_ONLY, dataclass, make_dataclass
+from typing import Annotated, Any, NoReturn
 
-from managed import DependencyRegistry
-from tests.fixtures import collection_dep, ctor_dep, dataclass_dep, generic_dep, simple_app
+import pytest
+
+from managed import DependencyOption, DependencyRegistry
+from managed._providers import COMPILE_AFTER_CALLS
+from managed.errors import CircularDependencyError, VarKeywordParameterNotSupportedError
+from tests.fixtures import (
+    circular_dep,
+    collection_dep,
+    ctor_dep,
+    dataclass_dep,
+    generic_dep,
+    simple_app,
+)
+
+
+def test_registry_builtin_vals():
+    reg = DependencyRegistry()
+
+    assert reg.get_dependency(DependencyRegistry) is reg
+    assert reg.get_dependency(type(None)) is None
 
 
 def test_registry_register_val():
@@ -30,6 +53,82 @@ def test_registry_register_val():
     assert reg.get_dependency(MyObject) is obj
 
 
+def test_registry_register_unhashable_val():
+    class Config(dict[str, str]): ...
+
+    config = Config()
+
+    reg = DependencyRegistry().register_val(config)
+
+    assert reg.get_dependency(Config) is config
+
+
+def test_registry_resolve_unhashable_type():
+    class MyObject: ...
+
+    obj = MyObject()
+
+    reg = DependencyRegistry().register_val(obj)
+
+    dep_type: Any = Annotated[MyObject, {"k": 1}]  # with an unhashable metadata
+
+    # not cacheable, so resolved every time
+    for _ in range(2):
+        assert reg.get_dependency(dep_type) is obj
+        assert reg.get_dependencies(dep_type) == [obj]
+
+
+def test_registry_resolve_union_in_order():
+    class A: ...
+
+    class B: ...
+
+    a, b = A(), B()
+
+    reg = DependencyRegistry().register_val(a).register_val(b)
+
+    a_or_b: Any = A | B
+    b_or_a: Any = B | A
+
+    # `A | B == B | A`, but each resolves to its first resolvable arg
+    for _ in range(2):
+        assert reg.get_dependency(a_or_b) is a
+        assert reg.get_dependency(b_or_a) is b
+        assert reg.get_dependencies(a_or_b) == [a]
+        assert reg.get_dependencies(b_or_a) == [b]
+
+
+def test_registry_resolution_keeps_provider_type():
+    reg = DependencyRegistry().scan([simple_app])
+
+    # resolutions are cached as providers, not as instances
+    assert reg.get_dependency(simple_app.SimpleDatabase) is not reg.get_dependency(
+        simple_app.SimpleDatabase
+    )
+    assert reg.get_dependency(simple_app.SimpleUserRepo) is reg.get_dependency(
+        simple_app.SimpleUserRepo
+    )
+
+    controllers = reg.get_dependencies(simple_app.Controller)
+    assert controllers is not reg.get_dependencies(simple_app.Controller)
+    assert controllers == reg.get_dependencies(simple_app.Controller)
+
+
+def test_registry_register_after_resolution():
+    class Base: ...
+
+    class Child1(Base): ...
+
+    class Child2(Base): ...
+
+    reg = DependencyRegistry().register_val(Child1())
+    assert len(reg.get_dependencies(Base)) == 1
+
+    # registration must not be shadowed by the previous resolution
+    _ = reg.register_val(Child2())
+    assert len(reg.get_dependencies(Base)) == 2
+
+
 def test_collection_dep():
     reg = DependencyRegistry().scan([collection_dep])
 
@@ -60,6 +159,97 @@ def test_dataclass_dep():
     assert isinstance(dep.repo, dataclass_dep.Repo)
 
 
+def test_dataclass_dep_with_kw_only_fields():
+    @dataclass
+    class Repo: ...
+
+    @dataclass
+    class Service:
+        first: Repo
+        defaulted: int = 0
+        _: KW_ONLY
+        second: Repo
+
+    option = DependencyOption(provider_type="factory")
+    reg = DependencyRegistry().register_ctor(Repo, option).register_ctor(Service, option)
+
+    for _ in range(COMPILE_AFTER_CALLS + 1):
+        dep = reg.get_dependency(Service)
+        assert isinstance(dep.first, Repo)
+        assert isinstance(dep.second, Repo)
+        assert dep.defaulted == 0
+
+
+def test_dataclass_dep_with_own_init():
+    @dataclass
+    class Repo: ...
+
+    @dataclass
+    class Cache: ...
+
+    @dataclass
+    class Service:
+        repo: Repo
+        cache: Cache
+
+        def __init__(self, cache: Cache, repo: Repo) -> None:  # params in another order
+            self.repo = repo
+            self.cache = cache
+
+    @dataclass(init=False)
+    class KeywordService:
+        repo: Repo
+
+        def __init__(self, *, repo: Repo) -> None:
+            self.repo = repo
+
+    option = DependencyOption(provider_type="factory")
+    reg = DependencyRegistry()
+    for ctor in (Repo, Cache, Service, KeywordService):
+        _ = reg.register_ctor(ctor, option)
+
+    for _ in range(COMPILE_AFTER_CALLS + 1):
+        service = reg.get_dependency(Service)
+        assert isinstance(service.repo, Repo)
+        assert isinstance(service.cache, Cache)
+
+        assert isinstance(reg.get_dependency(KeywordService).repo, Repo)
+
+
+def test_dataclass_dep_with_nested_annotated_field():
+    @dataclass
+    class Controller:
+        svc: generic_dep.Service[Annotated[generic_dep.PgRepo, "x"]]
+
+    reg = DependencyRegistry().scan([generic_dep])
+    _ = reg.register_ctor(Controller, DependencyOption(provider_type="singleton"))
+
+    dep = reg.get_dependency(Controller)
+    assert isinstance(dep.svc, generic_dep.PgUserService)
+
+
+def test_registry_does_not_keep_ctors_alive():
+    @dataclass
+    class Repo: ...
+
+    @dataclass
+    class Service:
+        repo: Repo
+
+    # as if `Repo` had a field annotated with `"Service | None"`, referring back to `Service`
+    Repo.__annotations__["service"] = Service | None
+
+    option = DependencyOption(provider_type="singleton")
+    reg = DependencyRegistry().register_ctor(Repo, option).register_ctor(Service, option)
+    assert isinstance(reg.get_dependency(Service).repo, Repo)
+
+    service_ref = weakref.ref(Service)
+    del reg, Repo, Service
+    _ = gc.collect()
+
+    assert service_ref() is None
+
+
 def test_generic_dep():
     reg = DependencyRegistry().scan([generic_dep])
 
@@ -117,3 +307,91 @@ def test_simple_app():
     assert type(user_db) is type(org_db)
     assert user_db is not reg.get_dependency(simple_app.SimpleDatabase)
     assert org_db is not reg.get_dependency(simple_app.SimpleDatabase)
+
+
+def test_compile():
+    reg = DependencyRegistry().scan([simple_app]).compile()
+
+    app = reg.get_dependency(simple_app.SimpleApp)
+    assert app is reg.get_dependency(simple_app.SimpleApp)
+    assert len(app.controllers) == 2
+
+
+def test_compile_resolves_registered_types(monkeypatch: pytest.MonkeyPatch):
+    reg = DependencyRegistry().scan([simple_app]).compile()
+
+    def fail(dep_type: object) -> NoReturn:
+        raise AssertionError(f"{dep_type} is not resolved by compile()")
+
+    monkeypatch.setattr(reg, "_resolve_provider", fail)
+    monkeypatch.setattr(reg, "_resolve_list_provider", fail)
+
+    assert isinstance(reg.get_dependency(simple_app.SimpleApp), simple_app.SimpleApp)
+    assert len(reg.get_dependencies(simple_app.Controller)) == 2
+
+
+def test_circular_dep():
+    reg = DependencyRegistry().scan([circular_dep])
+
+    with pytest.raises(CircularDependencyError) as exc_info:
+        _ = reg.get_dependency(circular_dep.Chicken)
+
+    assert exc_info.value.path == (circular_dep.Chicken, circular_dep.Egg, circular_dep.Chicken)
+    assert str(exc_info.value) == (
+        f"Circular dependency: `{circular_dep.Chicken}` -> `{circular_dep.Egg}` "
+        f"-> `{circular_dep.Chicken}`"
+    )
+
+    with pytest.raises(CircularDependencyError):
+        _ = reg.compile()
+
+
+def test_optional_circular_dep():
+    reg = DependencyRegistry().scan([circular_dep])
+
+    with pytest.raises(CircularDependencyError) as exc_info:
+        _ = reg.get_dependency(circular_dep.Tree)
+
+    assert exc_info.value.path == (circular_dep.Tree, circular_dep.Seed, circular_dep.Tree)
+
+
+def test_concurrent_lazy_resolution_is_not_circular():
+    # a chain of `C{i}(dep: C{i-1})`, deep enough for threads to interleave while building
+    chain: list[type[Any]] = [make_dataclass("C0", [])]
+    for i in range(1, 30):
+        chain.append(make_dataclass(f"C{i}", [("dep", chain[-1])]))
+
+    option = DependencyOption(provider_type="singleton")
+
+    old_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            reg = DependencyRegistry()
+            for cls in chain:
+                _ = reg.register_ctor(cls, option)
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(reg.get_dependency, chain[-1]) for _ in range(4)]
+
+            for future in futures:
+                assert isinstance(future.result(), chain[-1])
+
+    finally:
+        sys.setswitchinterval(old_interval)
+
+
+def test_var_keyword_param():
+    class Service: ...
+
+    def make_service(**kwargs: int) -> Service:
+        return Service(**kwargs)
+
+    reg = DependencyRegistry().register_ctor(
+        make_service,
+        DependencyOption(provider_type="singleton"),
+    )
+
+    # reported as is, rather than as the absence of `int`
+    with pytest.raises(VarKeywordParameterNotSupportedError):
+        _ = reg.get_dependency(Service)
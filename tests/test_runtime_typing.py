@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import weakref
+from dataclasses import dataclass
 from typing import Annotated
 
 import managed._runtime_typing as rtt
@@ -62,12 +65,77 @@ def test_get_bases_of_user_defined_types():
     class MyGenericDerived[V](MyGenericBase[V], MyOtherGenericBase[int], MySimpleBase):
         pass
 
+    (v,) = MyGenericDerived.__type_params__
+    (t,) = MyGenericBase.__type_params__
+
+    # parameterized bases are kept (the registry resolves `Service[PgRepo]` by them),
+    # while `Generic[V]` is not a base to resolve by
     assert rtt.get_bases(rtt.literal_typing_to_runtime_typing(MyGenericDerived[int])) == (
         MyGenericDerived[int],
         MyGenericDerived,
+        MyGenericBase[v],
         MyGenericBase,
+        list[t],
         list,
+        MyOtherGenericBase[int],
+        MyOtherGenericBase,
         MySimpleBase,
-        rtt.TypingGeneric,
         object,
     )
+
+
+def test_resolved_hints():
+    @dataclass
+    class WithHints:
+        a: Annotated[int, "meta"]
+        b: "str"
+
+    def func(x: WithHints) -> Annotated[int, "meta"]: ...
+
+    assert rtt.resolved_hints(WithHints) == {"a": Annotated[int, "meta"], "b": str}
+
+    hints = rtt.resolved_hints(func)
+    assert hints == {"x": WithHints, "return": Annotated[int, "meta"]}
+    assert rtt.resolved_hints(func) is hints
+
+    assert rtt.resolved_hints(len) == {}
+
+
+def test_resolved_hints_does_not_keep_types_alive():
+    class Node:
+        parent: object = None
+
+    # as if annotated with `"Node | None"`, which a local class cannot resolve
+    Node.__annotations__["parent"] = Node | None
+
+    def make_node() -> Node: ...
+
+    assert rtt.resolved_hints(Node) == {"parent": Node | None}
+    assert rtt.resolved_hints(make_node) == {"return": Node}
+
+    node_ref = weakref.ref(Node)
+    func_ref = weakref.ref(make_node)
+    del Node, make_node
+    _ = gc.collect()
+
+    assert node_ref() is None
+    assert func_ref() is None
+
+
+def test_get_bases_does_not_keep_types_alive():
+    class Local:
+        pass
+
+    local = rtt.literal_typing_to_runtime_typing(Local)
+    local_alias = rtt.literal_typing_to_runtime_typing(list[Local])
+
+    assert rtt.get_bases(local) == (Local, object)
+    assert rtt.get_bases(local) == (Local, object)  # cached
+    assert rtt.get_bases(local_alias) == (list[Local], list, object)
+    assert rtt.get_bases(local_alias) == (list[Local], list, object)  # cached
+
+    local_ref = weakref.ref(Local)
+    del Local, local, local_alias
+    _ = gc.collect()
+
+    assert local_ref() is None